@@ -0,0 +1 @@
+"""Unit tests for voice activation detection adapters."""
@@ -0,0 +1,104 @@
+"""Unit tests for WebRTCVAD adapter."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from voinux.adapters.vad.webrtc_adapter import WebRTCVAD
+from voinux.domain.entities import AudioChunk
+
+SAMPLE_RATE = 16000
+FRAME_SIZE = (SAMPLE_RATE * WebRTCVAD.FRAME_DURATION_MS) // 1000
+
+
+class FakeVad:
+    """Stand-in for webrtcvad.Vad that treats any non-silent frame as speech."""
+
+    def __init__(self) -> None:
+        """Initialize call tracking."""
+        self.frames: list[bytes] = []
+        self.sample_rates: list[int] = []
+
+    def is_speech(self, buf: bytes, sample_rate: int) -> bool:
+        """Classify a frame and record what was passed in."""
+        self.frames.append(buf)
+        self.sample_rates.append(sample_rate)
+        return any(buf)
+
+
+def make_frames(*speech: bool, extra_samples: int = 0) -> np.ndarray:
+    """Create audio with one full VAD frame per flag, plus trailing samples."""
+    frames = [np.full(FRAME_SIZE, 0.5 if flag else 0.0, dtype=np.float32) for flag in speech]
+    frames.append(np.full(extra_samples, 0.5, dtype=np.float32))
+    return np.concatenate(frames)
+
+
+def make_chunk(audio_data: np.ndarray) -> AudioChunk:
+    """Wrap samples in an audio chunk."""
+    return AudioChunk(
+        data=audio_data,
+        sample_rate=SAMPLE_RATE,
+        timestamp=datetime.now(),
+        duration_ms=(len(audio_data) * 1000) // SAMPLE_RATE,
+    )
+
+
+class TestWebRTCVAD:
+    """Test suite for WebRTCVAD frame analysis."""
+
+    @pytest.fixture
+    def fake_vad(self) -> FakeVad:
+        """Create a fake WebRTC VAD instance."""
+        return FakeVad()
+
+    @pytest.fixture
+    def adapter(self, fake_vad: FakeVad) -> WebRTCVAD:
+        """Create an adapter wired to the fake VAD instance."""
+        adapter = WebRTCVAD()
+        adapter.sample_rate = SAMPLE_RATE
+        adapter.frame_size = FRAME_SIZE
+        adapter.vad = fake_vad  # type: ignore[assignment]
+        return adapter
+
+    def test_frames_are_full_size_and_partial_frame_is_ignored(
+        self, adapter: WebRTCVAD, fake_vad: FakeVad
+    ) -> None:
+        """Test that each frame is frame_size int16 samples and a trailing partial frame is skipped."""
+        audio_data = make_frames(True, False, True, extra_samples=FRAME_SIZE // 2)
+
+        speech_frames, total_frames = adapter._count_speech_frames(fake_vad, audio_data)  # type: ignore[arg-type]
+
+        assert (speech_frames, total_frames) == (2, 3)
+        assert [len(frame) for frame in fake_vad.frames] == [FRAME_SIZE * 2] * 3
+        assert fake_vad.sample_rates == [SAMPLE_RATE] * 3
+
+    def test_chunk_shorter_than_a_frame_has_no_frames(
+        self, adapter: WebRTCVAD, fake_vad: FakeVad
+    ) -> None:
+        """Test that a chunk shorter than one frame is never passed to the VAD."""
+        audio_data = make_frames(extra_samples=FRAME_SIZE - 1)
+
+        assert adapter._count_speech_frames(fake_vad, audio_data) == (0, 0)  # type: ignore[arg-type]
+        assert fake_vad.frames == []
+
+    async def test_is_speech_requires_frame_majority(self, adapter: WebRTCVAD) -> None:
+        """Test that a chunk is speech only when more than half of its frames are."""
+        assert await adapter.is_speech(make_chunk(make_frames(True, True, True, False)))
+        assert not await adapter.is_speech(make_chunk(make_frames(True, True, False, False)))
+        assert not await adapter.is_speech(make_chunk(make_frames(extra_samples=FRAME_SIZE // 2)))
+
+    async def test_batch_matches_single_chunk_decisions(self, adapter: WebRTCVAD) -> None:
+        """Test that batched decisions are in chunk order and match is_speech."""
+        chunks = [
+            make_chunk(make_frames(True, True, False)),
+            make_chunk(make_frames(False, False, True)),
+            make_chunk(make_frames(True, False, extra_samples=FRAME_SIZE // 2)),
+            make_chunk(make_frames(extra_samples=FRAME_SIZE // 2)),
+            make_chunk(make_frames(True, True, True, extra_samples=1)),
+        ]
+
+        speech_flags = await adapter.is_speech_batch(chunks)
+
+        assert speech_flags == [True, False, False, False, True]
+        assert speech_flags == [await adapter.is_speech(chunk) for chunk in chunks]
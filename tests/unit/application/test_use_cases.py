@@ -0,0 +1,158 @@
+"""Unit tests for application use cases."""
+
+import asyncio
+import signal
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from voinux.application import use_cases
+from voinux.application.use_cases import StartTranscription
+from voinux.config.config import Config
+from voinux.domain.exceptions import InitializationError
+
+
+class FakePipeline:
+    """Pipeline stand-in that runs a hook instead of capturing audio."""
+
+    def __init__(self) -> None:
+        """Initialize hook and call tracking."""
+        self.on_start: Callable[[], None] | None = None
+        self.start_error: Exception | None = None
+        self.stopped = False
+
+    async def start(self) -> None:
+        """Run the start hook, then return or fail."""
+        if self.on_start:
+            self.on_start()
+        if self.start_error:
+            raise self.start_error
+
+    async def stop(self) -> None:
+        """Stop after yielding to the event loop, like a real adapter shutdown."""
+        await asyncio.sleep(0)
+        self.stopped = True
+
+
+@pytest.fixture
+def pipeline(monkeypatch: pytest.MonkeyPatch) -> FakePipeline:
+    """Patch the adapter factories and the pipeline with fakes."""
+    model_manager = Mock()
+    model_manager.get_model_path = AsyncMock(return_value="/models/base")
+    monkeypatch.setattr(use_cases, "create_model_manager", Mock(return_value=model_manager))
+    for factory in (
+        "create_audio_capture",
+        "create_vad",
+        "create_audio_processor",
+        "create_speech_recognizer",
+        "create_keyboard_simulator",
+    ):
+        monkeypatch.setattr(use_cases, factory, AsyncMock())
+
+    pipeline = FakePipeline()
+    monkeypatch.setattr(use_cases, "TranscriptionPipeline", Mock(return_value=pipeline))
+    return pipeline
+
+
+@pytest.fixture
+async def loop(monkeypatch: pytest.MonkeyPatch) -> asyncio.AbstractEventLoop:
+    """Replace the running loop's signal handler registration with mocks."""
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(loop, "add_signal_handler", Mock())
+    monkeypatch.setattr(loop, "remove_signal_handler", Mock())
+    return loop
+
+
+def installed_handler(loop: asyncio.AbstractEventLoop) -> Callable[[], None]:
+    """Return the callback registered for SIGINT."""
+    add_signal_handler: Any = loop.add_signal_handler
+    for call in add_signal_handler.call_args_list:
+        if call.args[0] == signal.SIGINT:
+            handler: Callable[[], None] = call.args[1]
+            return handler
+    raise AssertionError("No SIGINT handler installed")
+
+
+class TestStartTranscription:
+    """Tests for StartTranscription lifecycle handling."""
+
+    async def test_awaits_pending_stop_before_returning(
+        self, pipeline: FakePipeline, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Test that a signal-triggered stop finishes before execute() returns."""
+        use_case = StartTranscription(Config())
+
+        def send_sigint() -> None:
+            installed_handler(loop)()
+
+        pipeline.on_start = send_sigint
+
+        session = await use_case.execute()
+
+        assert pipeline.stopped
+        assert not use_case._stop_tasks
+        assert not session.is_active
+
+    @pytest.mark.usefixtures("pipeline")
+    async def test_removes_signal_handlers_on_success(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Test that SIGINT/SIGTERM handlers are removed after a completed session."""
+        use_case = StartTranscription(Config())
+
+        await use_case.execute()
+
+        remove_signal_handler: Any = loop.remove_signal_handler
+        removed = [call.args[0] for call in remove_signal_handler.call_args_list]
+        assert removed == [signal.SIGINT, signal.SIGTERM]
+        assert use_case.pipeline is None
+
+    async def test_removes_signal_handlers_on_failure(
+        self, pipeline: FakePipeline, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Test that SIGINT/SIGTERM handlers are removed when the pipeline fails."""
+        use_case = StartTranscription(Config())
+        pipeline.start_error = RuntimeError("capture failed")
+
+        with pytest.raises(InitializationError, match="capture failed"):
+            await use_case.execute()
+
+        remove_signal_handler: Any = loop.remove_signal_handler
+        removed = [call.args[0] for call in remove_signal_handler.call_args_list]
+        assert removed == [signal.SIGINT, signal.SIGTERM]
+        assert use_case.pipeline is None
+
+    async def test_awaits_pending_stop_on_failure(
+        self, pipeline: FakePipeline, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Test that a signal-triggered stop finishes even when the pipeline fails."""
+        use_case = StartTranscription(Config())
+
+        def send_sigint() -> None:
+            installed_handler(loop)()
+
+        pipeline.on_start = send_sigint
+        pipeline.start_error = RuntimeError("capture failed")
+
+        with pytest.raises(InitializationError, match="capture failed"):
+            await use_case.execute()
+
+        assert pipeline.stopped
+        assert not use_case._stop_tasks
+
+    @pytest.mark.usefixtures("pipeline")
+    async def test_skips_signal_handlers_when_disabled(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Test that no handlers are touched when signal handling is left to the caller."""
+        use_case = StartTranscription(Config())
+
+        await use_case.execute(install_signal_handlers=False)
+
+        add_signal_handler: Any = loop.add_signal_handler
+        remove_signal_handler: Any = loop.remove_signal_handler
+        add_signal_handler.assert_not_called()
+        remove_signal_handler.assert_not_called()
+        assert use_case.pipeline is None
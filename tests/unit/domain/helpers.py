@@ -0,0 +1,18 @@
+"""Shared helpers for domain unit tests."""
+
+from datetime import datetime
+
+import numpy as np
+
+from voinux.domain.entities import AudioChunk
+
+
+def make_chunk(value: float, duration_ms: int = 100, sample_rate: int = 16000) -> AudioChunk:
+    """Create a constant-valued audio chunk."""
+    num_samples = (sample_rate * duration_ms) // 1000
+    return AudioChunk(
+        data=np.full(num_samples, value, dtype=np.float32),
+        sample_rate=sample_rate,
+        timestamp=datetime.now(),
+        duration_ms=duration_ms,
+    )
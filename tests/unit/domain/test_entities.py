@@ -0,0 +1,118 @@
+"""Unit tests for domain entities."""
+
+import numpy as np
+import pytest
+
+from tests.unit.domain.helpers import make_chunk
+from voinux.domain.entities import BufferConfig, SpeechBuffer, SpeechState
+
+
+class TestSpeechBuffer:
+    """Tests for SpeechBuffer."""
+
+    @pytest.fixture
+    def buffer(self) -> SpeechBuffer:
+        """Create a speech buffer with a 1 second limit."""
+        return SpeechBuffer(
+            buffer_config=BufferConfig(silence_threshold_ms=200, max_buffer_duration_ms=1000),
+            sample_rate=16000,
+        )
+
+    def test_concatenates_speech_chunks_in_order(self, buffer: SpeechBuffer) -> None:
+        """Test that only speech chunks are buffered, in order."""
+        first = make_chunk(0.25)
+        buffer.add_chunk(first, is_speech=True)
+        buffer.add_chunk(make_chunk(0.75), is_speech=True)
+        buffer.add_chunk(make_chunk(0.9), is_speech=False)
+
+        audio = buffer.get_concatenated_audio()
+
+        assert buffer.state == SpeechState.BUFFERING
+        assert buffer.buffered_chunk_count == 2
+        assert audio.duration_ms == 200
+        assert audio.timestamp == first.timestamp
+        np.testing.assert_array_equal(audio.data[:1600], 0.25)
+        np.testing.assert_array_equal(audio.data[1600:], 0.75)
+        assert len(audio.data) == 3200
+
+    def test_concatenated_audio_survives_reset(self, buffer: SpeechBuffer) -> None:
+        """Test that audio handed out is not overwritten by the next utterance."""
+        buffer.add_chunk(make_chunk(0.25), is_speech=True)
+        audio = buffer.get_concatenated_audio()
+        buffer.reset()
+
+        buffer.add_chunk(make_chunk(0.5), is_speech=True)
+
+        np.testing.assert_array_equal(audio.data, 0.25)
+        np.testing.assert_array_equal(buffer.get_concatenated_audio().data, 0.5)
+
+    def test_grows_past_max_duration(self, buffer: SpeechBuffer) -> None:
+        """Test that a chunk overshooting the max duration is still buffered."""
+        for _ in range(11):
+            buffer.add_chunk(make_chunk(0.125), is_speech=True)
+
+        audio = buffer.get_concatenated_audio()
+
+        assert buffer.should_process() is True
+        assert len(audio.data) == 11 * 1600
+        np.testing.assert_array_equal(audio.data, 0.125)
+
+    def test_adaptive_silence_threshold(self) -> None:
+        """Test that the silence wait scales with the buffered speech duration."""
+        buffer = SpeechBuffer(
+            buffer_config=BufferConfig(
+                silence_threshold_ms=1200,
+                adaptive_silence_threshold=True,
+                min_silence_threshold_ms=300,
+            ),
+            sample_rate=16000,
+        )
+
+        buffer.add_chunk(make_chunk(0.25, duration_ms=200), is_speech=True)
+        assert buffer.silence_threshold_ms() == 300
+
+        buffer.add_chunk(make_chunk(0.25, duration_ms=800), is_speech=True)
+        assert buffer.silence_threshold_ms() == 600
+
+        buffer.add_chunk(make_chunk(0.25, duration_ms=2000), is_speech=True)
+        assert buffer.silence_threshold_ms() == 1200
+
+    def test_adaptive_threshold_never_exceeds_configured_threshold(self) -> None:
+        """Test that a minimum above the configured threshold doesn't lengthen the wait."""
+        buffer = SpeechBuffer(
+            buffer_config=BufferConfig(
+                silence_threshold_ms=200,
+                adaptive_silence_threshold=True,
+                min_silence_threshold_ms=300,
+            ),
+            sample_rate=16000,
+        )
+        buffer.add_chunk(make_chunk(0.25, duration_ms=500), is_speech=True)
+
+        assert buffer.silence_threshold_ms() == 200
+
+        buffer.add_chunk(make_chunk(0.0, duration_ms=200), is_speech=False)
+        assert buffer.should_process() is True
+
+    def test_adaptive_threshold_processes_short_utterance_early(self) -> None:
+        """Test that a short utterance is processed after the minimum silence."""
+        buffer = SpeechBuffer(
+            buffer_config=BufferConfig(
+                silence_threshold_ms=1200,
+                adaptive_silence_threshold=True,
+                min_silence_threshold_ms=300,
+            ),
+            sample_rate=16000,
+        )
+        buffer.add_chunk(make_chunk(0.25, duration_ms=500), is_speech=True)
+
+        buffer.add_chunk(make_chunk(0.0, duration_ms=200), is_speech=False)
+        assert buffer.should_process() is False
+
+        buffer.add_chunk(make_chunk(0.0, duration_ms=100), is_speech=False)
+        assert buffer.should_process() is True
+
+    def test_empty_buffer_raises(self, buffer: SpeechBuffer) -> None:
+        """Test that concatenating an empty buffer fails."""
+        with pytest.raises(ValueError, match="empty buffer"):
+            buffer.get_concatenated_audio()
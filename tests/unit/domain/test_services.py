@@ -0,0 +1,338 @@
+"""Unit tests for TranscriptionPipeline."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from tests.unit.domain.helpers import make_chunk
+from voinux.domain.entities import (
+    AudioChunk,
+    BufferConfig,
+    ModelConfig,
+    TranscriptionResult,
+    TranscriptionSession,
+)
+from voinux.domain.exceptions import TranscriptionError, VADError
+from voinux.domain.ports import IAudioCapture, IVoiceActivationDetector
+from voinux.domain.services import TranscriptionPipeline
+
+
+class FakeAudioCapture(IAudioCapture):
+    """Audio capture that replays a fixed list of chunks."""
+
+    def __init__(self, chunks: list[AudioChunk]) -> None:
+        """Initialize with the chunks to replay."""
+        self.chunks = chunks
+
+    async def start(self) -> None:
+        """Start capture (no-op)."""
+
+    async def stop(self) -> None:
+        """Stop capture (no-op)."""
+
+    async def stream(self) -> AsyncIterator[AudioChunk]:
+        """Yield the configured chunks."""
+        for chunk in self.chunks:
+            yield chunk
+
+
+class FakeVAD(IVoiceActivationDetector):
+    """VAD that classifies chunks by their mean amplitude."""
+
+    def __init__(self) -> None:
+        """Initialize call tracking."""
+        self.single_calls = 0
+        self.batch_sizes: list[int] = []
+
+    async def initialize(self, threshold: float, sample_rate: int) -> None:
+        """Initialize (no-op)."""
+
+    async def is_speech(self, audio_chunk: AudioChunk) -> bool:
+        """Classify a single chunk."""
+        self.single_calls += 1
+        return bool(np.abs(audio_chunk.data).mean() > 0.1)
+
+    async def is_speech_batch(self, audio_chunks: list[AudioChunk]) -> list[bool]:
+        """Classify a batch of chunks."""
+        self.batch_sizes.append(len(audio_chunks))
+        return [bool(np.abs(chunk.data).mean() > 0.1) for chunk in audio_chunks]
+
+    async def shutdown(self) -> None:
+        """Shut down (no-op)."""
+
+
+@pytest.fixture
+def session() -> TranscriptionSession:
+    """Create a transcription session."""
+    model_config = ModelConfig(
+        model_name="base",
+        device="cpu",
+        compute_type="int8",
+        beam_size=1,
+        language="en",
+        vad_filter=False,
+        model_path=None,
+    )
+    return TranscriptionSession(
+        session_id="test", started_at=datetime.now(), model_config=model_config
+    )
+
+
+@pytest.fixture
+def recognizer() -> AsyncMock:
+    """Create a mock speech recognizer."""
+    recognizer = AsyncMock()
+    recognizer.transcribe.return_value = TranscriptionResult(
+        text="hello world",
+        language="en",
+        confidence=0.9,
+        processing_time_ms=10,
+        timestamp=datetime.now(),
+    )
+    return recognizer
+
+
+def make_pipeline(
+    chunks: list[AudioChunk],
+    vad: IVoiceActivationDetector,
+    recognizer: AsyncMock,
+    session: TranscriptionSession,
+    buffer_config: BufferConfig,
+) -> tuple[TranscriptionPipeline, AsyncMock]:
+    """Create a pipeline wired to fake adapters."""
+    keyboard = AsyncMock()
+    pipeline = TranscriptionPipeline(
+        audio_capture=FakeAudioCapture(chunks),
+        vad=vad,
+        recognizer=recognizer,
+        keyboard=keyboard,
+        session=session,
+        buffer_config=buffer_config,
+    )
+    return pipeline, keyboard
+
+
+class TestTranscriptionPipelineBatching:
+    """Tests for batched voice activation detection."""
+
+    async def test_batches_vad_calls(
+        self, session: TranscriptionSession, recognizer: AsyncMock
+    ) -> None:
+        """Test that chunks are sent to the VAD in batches, flushing the remainder."""
+        chunks = [make_chunk(0.5)] * 5 + [make_chunk(0.0)] * 6
+        vad = FakeVAD()
+        pipeline, keyboard = make_pipeline(
+            chunks,
+            vad,
+            recognizer,
+            session,
+            BufferConfig(silence_threshold_ms=500, vad_batch_size=4),
+        )
+
+        await pipeline.start()
+
+        assert vad.batch_sizes == [4, 4, 3]
+        assert vad.single_calls == 0
+        assert session.total_chunks_processed == 11
+        assert session.total_speech_chunks == 5
+        recognizer.transcribe.assert_awaited_once()
+        keyboard.type_text.assert_awaited_once_with("hello world")
+
+    async def test_default_batch_calls_vad_per_chunk(
+        self, session: TranscriptionSession, recognizer: AsyncMock
+    ) -> None:
+        """Test that the default batch size keeps one VAD call per chunk."""
+        chunks = [make_chunk(0.5)] * 3 + [make_chunk(0.0)] * 2
+        vad = FakeVAD()
+        pipeline, _ = make_pipeline(chunks, vad, recognizer, session, BufferConfig())
+
+        await pipeline.start()
+
+        assert vad.batch_sizes == [1, 1, 1, 1, 1]
+        assert session.total_speech_chunks == 3
+
+    async def test_peak_gate_skips_vad_only_while_idle(
+        self, session: TranscriptionSession, recognizer: AsyncMock
+    ) -> None:
+        """Test that quiet chunks skip the VAD unless an utterance is being buffered."""
+        chunks = [make_chunk(0.0)] * 3 + [make_chunk(0.5)] * 4 + [make_chunk(0.0)] * 5
+        vad = FakeVAD()
+        pipeline, _ = make_pipeline(
+            chunks,
+            vad,
+            recognizer,
+            session,
+            BufferConfig(silence_threshold_ms=300, silence_peak_threshold=0.01),
+        )
+
+        await pipeline.start()
+
+        # Leading and post-utterance silence is gated; the utterance tail is not
+        assert vad.batch_sizes == [1] * 7
+        assert session.total_chunks_processed == 12
+        assert session.total_speech_chunks == 4
+        recognizer.transcribe.assert_awaited_once()
+
+
+class TestTranscriptionPipelineStages:
+    """Tests for the queued capture → VAD → transcription stages."""
+
+    async def test_transcribes_each_utterance_in_order(
+        self, session: TranscriptionSession, recognizer: AsyncMock
+    ) -> None:
+        """Test that consecutive utterances are transcribed in capture order."""
+        chunks = ([make_chunk(0.5)] * 4 + [make_chunk(0.0)] * 3) * 2 + [make_chunk(0.5)] * 4
+        pipeline, _ = make_pipeline(
+            chunks, FakeVAD(), recognizer, session, BufferConfig(silence_threshold_ms=300)
+        )
+
+        await pipeline.start()
+
+        # The trailing utterance never reaches the silence threshold
+        assert recognizer.transcribe.await_count == 2
+        assert session.total_utterances_processed == 2
+        assert session.total_utterance_duration_ms == 800
+
+    async def test_transcription_failure_stops_pipeline(
+        self, session: TranscriptionSession, recognizer: AsyncMock
+    ) -> None:
+        """Test that a failing stage cancels the pipeline and raises."""
+        recognizer.transcribe.side_effect = RuntimeError("model crashed")
+        chunks = [make_chunk(0.5)] * 4 + [make_chunk(0.0)] * 20
+        pipeline, keyboard = make_pipeline(
+            chunks, FakeVAD(), recognizer, session, BufferConfig(silence_threshold_ms=300)
+        )
+
+        with pytest.raises(TranscriptionError, match="model crashed"):
+            await pipeline.start()
+
+        keyboard.type_text.assert_not_awaited()
+        assert session.is_active is False
+
+    async def test_noise_suppression_stage_feeds_vad(
+        self, session: TranscriptionSession, recognizer: AsyncMock
+    ) -> None:
+        """Test that every chunk passes through the noise suppressor before VAD."""
+        chunks = [make_chunk(0.5)] * 4 + [make_chunk(0.0)] * 3
+        noise_suppressor = AsyncMock()
+        noise_suppressor.process.side_effect = lambda chunk: chunk
+        pipeline = TranscriptionPipeline(
+            audio_capture=FakeAudioCapture(chunks),
+            vad=FakeVAD(),
+            recognizer=recognizer,
+            keyboard=AsyncMock(),
+            session=session,
+            buffer_config=BufferConfig(silence_threshold_ms=300),
+            noise_suppressor=noise_suppressor,
+        )
+
+        await pipeline.start()
+
+        assert noise_suppressor.process.await_count == 7
+        assert session.total_speech_chunks == 4
+        recognizer.transcribe.assert_awaited_once()
+
+    async def test_typing_does_not_block_transcription(
+        self, session: TranscriptionSession, recognizer: AsyncMock
+    ) -> None:
+        """Test that the next utterance is transcribed while the previous one is typed."""
+        both_transcribed = asyncio.Event()
+
+        async def transcribe(_audio_chunk: AudioChunk) -> TranscriptionResult:
+            if recognizer.transcribe.await_count == 2:
+                both_transcribed.set()
+            return recognizer.transcribe.return_value
+
+        async def type_text(_text: str) -> None:
+            await both_transcribed.wait()
+
+        recognizer.transcribe.side_effect = transcribe
+        chunks = ([make_chunk(0.5)] * 4 + [make_chunk(0.0)] * 3) * 2
+        pipeline, keyboard = make_pipeline(
+            chunks, FakeVAD(), recognizer, session, BufferConfig(silence_threshold_ms=300)
+        )
+        keyboard.type_text.side_effect = type_text
+
+        await asyncio.wait_for(pipeline.start(), timeout=5)
+
+        assert keyboard.type_text.await_count == 2
+        assert session.total_characters_typed == 2 * len("hello world")
+
+    async def test_types_in_flight_transcription_after_stop(
+        self, session: TranscriptionSession, recognizer: AsyncMock
+    ) -> None:
+        """Test that text transcribed while stop() runs is still typed."""
+        pipeline: TranscriptionPipeline | None = None
+
+        async def transcribe(_audio_chunk: AudioChunk) -> TranscriptionResult:
+            assert pipeline is not None
+            await pipeline.stop()
+            return TranscriptionResult(
+                text="last words",
+                language="en",
+                confidence=0.9,
+                processing_time_ms=10,
+                timestamp=datetime.now(),
+            )
+
+        recognizer.transcribe.side_effect = transcribe
+        chunks = [make_chunk(0.5)] * 4 + [make_chunk(0.0)] * 20
+        pipeline, keyboard = make_pipeline(
+            chunks, FakeVAD(), recognizer, session, BufferConfig(silence_threshold_ms=300)
+        )
+
+        await asyncio.wait_for(pipeline.start(), timeout=5)
+
+        keyboard.type_text.assert_awaited_once_with("last words")
+        assert session.total_utterances_processed == 1
+        assert session.total_characters_typed == len("last words")
+
+    async def test_warns_about_utterances_discarded_after_stop(
+        self,
+        session: TranscriptionSession,
+        recognizer: AsyncMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that utterances still queued when stop() runs are logged as discarded."""
+        pipeline: TranscriptionPipeline | None = None
+
+        async def transcribe(_audio_chunk: AudioChunk) -> TranscriptionResult:
+            assert pipeline is not None
+            # Wait for the second utterance to be queued behind this one
+            while pipeline._utterance_queue.empty():
+                await asyncio.sleep(0)
+            await pipeline.stop()
+            return recognizer.transcribe.return_value
+
+        recognizer.transcribe.side_effect = transcribe
+        chunks = ([make_chunk(0.5)] * 4 + [make_chunk(0.0)] * 3) * 2
+        pipeline, keyboard = make_pipeline(
+            chunks, FakeVAD(), recognizer, session, BufferConfig(silence_threshold_ms=300)
+        )
+
+        with caplog.at_level(logging.WARNING, logger="voinux.domain.services"):
+            await asyncio.wait_for(pipeline.start(), timeout=5)
+
+        recognizer.transcribe.assert_awaited_once()
+        keyboard.type_text.assert_awaited_once_with("hello world")
+        assert "Discarded 1 queued utterance(s)" in caplog.text
+
+    async def test_stop_shuts_down_remaining_adapters_after_failure(
+        self, session: TranscriptionSession, recognizer: AsyncMock
+    ) -> None:
+        """Test that a failing adapter shutdown doesn't skip the others."""
+        vad = FakeVAD()
+        vad.shutdown = AsyncMock(side_effect=VADError("already closed"))  # type: ignore[method-assign]
+        pipeline, _ = make_pipeline([make_chunk(0.0)], vad, recognizer, session, BufferConfig())
+        await pipeline.start()
+
+        await pipeline.stop()
+
+        vad.shutdown.assert_awaited_once()
+        recognizer.shutdown.assert_awaited_once()
+        assert session.is_active is False
@@ -97,21 +97,14 @@ class SilenceTrimmer(IAudioProcessor):
             if num_frames == 0:
                 return audio_chunk
 
-            energy_db = np.zeros(num_frames)
-
-            for i in range(num_frames):
-                start_idx = i * frame_size
-                end_idx = start_idx + frame_size
-                frame = audio_data[start_idx:end_idx]
-
-                # Calculate RMS (root mean square)
-                rms = np.sqrt(np.mean(frame**2))
-
-                # Convert to decibels (with floor to avoid log(0))
-                if rms > 0:
-                    energy_db[i] = 20 * np.log10(rms)
-                else:
-                    energy_db[i] = -100.0  # Very low energy
+            # View the audio as (frames, samples) and compute every frame's RMS at once;
+            # einsum sums the squares without materializing a squared copy
+            frames = audio_data[: num_frames * frame_size].reshape(num_frames, frame_size)
+            rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame_size)
+
+            # Convert to decibels (with floor to avoid log(0))
+            with np.errstate(divide="ignore"):
+                energy_db = np.where(rms > 0, 20 * np.log10(rms), -100.0)
 
             # Find first and last frames above threshold
             above_threshold = energy_db > self.threshold_db
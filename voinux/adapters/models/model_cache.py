@@ -92,7 +92,7 @@ class ModelCache(IModelManager):
             model_name: Name of the model
 
         Returns:
-            Optional[Path]: Path to the model, or None if not cached
+            Path | None: Path to the model, or None if not cached
         """
         # Check standard cache location
         model_path = self.models_dir / model_name
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import noisereduce as nr
 import numpy as np
@@ -46,6 +46,7 @@ class NoiseReduceProcessor(IAudioProcessor):
         self.freq_mask_smooth_hz = freq_mask_smooth_hz
         self.time_mask_smooth_ms = time_mask_smooth_ms
         self.sample_rate: int = 16000
+        self.executor: ThreadPoolExecutor | None = None
         self._initialized = False
 
     async def initialize(self, sample_rate: int) -> None:
@@ -59,6 +60,10 @@ class NoiseReduceProcessor(IAudioProcessor):
         """
         try:
             self.sample_rate = sample_rate
+
+            # Dedicated worker keeps chunks in order and off the shared default pool
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="voinux-noise")
             self._initialized = True
 
             logger.info(
@@ -93,16 +98,16 @@ class NoiseReduceProcessor(IAudioProcessor):
             # Run noise reduction in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
             reduced_audio = await loop.run_in_executor(
-                None,
+                self.executor,
                 self._reduce_noise,
                 audio_chunk.data,
             )
 
-            # Create new audio chunk with reduced noise
+            # Create new audio chunk with reduced noise, keeping the capture timestamp
             return AudioChunk(
                 data=reduced_audio,
                 sample_rate=audio_chunk.sample_rate,
-                timestamp=datetime.now(),
+                timestamp=audio_chunk.timestamp,
                 duration_ms=audio_chunk.duration_ms,
             )
 
@@ -136,4 +141,9 @@ class NoiseReduceProcessor(IAudioProcessor):
         """Shut down the processor and release resources."""
         logger.info("Shutting down noise suppressor")
         self._initialized = False
+
+        if self.executor:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
         logger.debug("Noise suppressor shutdown complete")
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import time
 from datetime import datetime
 from typing import Any
 
@@ -87,7 +88,7 @@ class GeminiRecognizer(ISpeechRecognizer):
         if not self._initialized or not self.client:
             raise TranscriptionError("Recognizer not initialized")
 
-        start_time = datetime.now()
+        start_ns = time.monotonic_ns()
 
         try:
             # Convert float32 audio to WAV format bytes
@@ -158,8 +159,7 @@ class GeminiRecognizer(ISpeechRecognizer):
                 final_text = transcribed_text.strip()
 
             # Calculate processing time
-            end_time = datetime.now()
-            processing_time_ms = int((end_time - start_time).total_seconds() * 1000)
+            processing_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
             # Estimate tokens used (32 tokens/sec of audio)
             duration_sec = audio_chunk.duration_ms / 1000.0
@@ -177,7 +177,7 @@ class GeminiRecognizer(ISpeechRecognizer):
                 language=self.model_config.language if self.model_config else None,
                 confidence=1.0,  # Gemini doesn't provide confidence scores
                 processing_time_ms=processing_time_ms,
-                timestamp=end_time,
+                timestamp=datetime.now(),
             )
 
         except Exception as e:
@@ -45,11 +45,13 @@ class WhisperRecognizer(ISpeechRecognizer):
         """
         try:
             logger.info(
-                "Initializing Whisper recognizer (model=%s, device=%s, compute_type=%s, beam_size=%d)",
+                "Initializing Whisper recognizer (model=%s, device=%s, compute_type=%s, "
+                "beam_size=%d, cpu_threads=%d)",
                 model_config.model_name,
                 model_config.device,
                 model_config.compute_type,
                 model_config.beam_size,
+                model_config.cpu_threads,
             )
 
             self.model_config = model_config
@@ -66,7 +68,9 @@ class WhisperRecognizer(ISpeechRecognizer):
             model_path = model_config.model_path or model_config.model_name
             logger.debug("Model path: %s", model_path)
 
-            # Create thread pool executor (single thread to avoid memory duplication)
+            # Create thread pool executor (single thread to avoid memory duplication).
+            # CTranslate2 releases the GIL during inference, so the event loop keeps
+            # running while a transcription is in progress.
             self.executor = ThreadPoolExecutor(max_workers=1)
 
             # Initialize model in thread pool
@@ -78,6 +82,7 @@ class WhisperRecognizer(ISpeechRecognizer):
                     model_path,
                     device=device,
                     compute_type=model_config.compute_type,
+                    cpu_threads=model_config.cpu_threads,
                 ),
             )
 
@@ -113,7 +118,7 @@ class WhisperRecognizer(ISpeechRecognizer):
                 audio_chunk.duration_ms,
             )
 
-            start_time = time.time()
+            start_ns = time.monotonic_ns()
 
             # Run transcription in thread pool
             loop = asyncio.get_event_loop()
@@ -131,7 +136,7 @@ class WhisperRecognizer(ISpeechRecognizer):
             text = " ".join(segment.text for segment in segments)
 
             # Calculate processing time
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
             # Get language and confidence
             language = info.language if hasattr(info, "language") else None
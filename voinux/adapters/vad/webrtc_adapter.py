@@ -102,33 +102,14 @@ class WebRTCVAD(IVoiceActivationDetector):
             raise VADError("VAD not initialized. Call initialize() first.")
 
         try:
-            # Convert float32 audio to int16 PCM
-            audio_int16 = self._float32_to_int16(audio_chunk.data)
-
-            # Process in frames
-            num_samples = len(audio_int16)
-            speech_frames = 0
-            total_frames = 0
-
-            for i in range(0, num_samples - self.frame_size + 1, self.frame_size):
-                frame = audio_int16[i : i + self.frame_size]
-
-                # VAD requires bytes
-                frame_bytes = frame.tobytes()
-
-                # Run VAD on frame
-                # Run in thread pool since webrtcvad is synchronous
-                loop = asyncio.get_event_loop()
-                is_speech_frame = await loop.run_in_executor(
-                    None,
-                    self.vad.is_speech,
-                    frame_bytes,
-                    self.sample_rate,
-                )
-
-                if is_speech_frame:
-                    speech_frames += 1
-                total_frames += 1
+            # Run all frames in a single thread pool call since webrtcvad is synchronous
+            loop = asyncio.get_event_loop()
+            speech_frames, total_frames = await loop.run_in_executor(
+                None,
+                self._count_speech_frames,
+                self.vad,
+                audio_chunk.data,
+            )
 
             # Consider speech if majority of frames contain speech
             if total_frames == 0:
@@ -151,6 +132,85 @@ class WebRTCVAD(IVoiceActivationDetector):
         else:
             return is_speech
 
+    async def is_speech_batch(self, audio_chunks: list[AudioChunk]) -> list[bool]:
+        """Determine which of several audio chunks contain speech.
+
+        All frames of all chunks are analyzed in a single thread pool call.
+
+        Args:
+            audio_chunks: Audio chunks to analyze, in capture order
+
+        Returns:
+            list[bool]: Speech decision for each chunk, in the same order
+
+        Raises:
+            VADError: If detection fails
+        """
+        if self.vad is None:
+            raise VADError("VAD not initialized. Call initialize() first.")
+
+        try:
+            loop = asyncio.get_event_loop()
+            speech_flags = await loop.run_in_executor(
+                None,
+                self._detect_speech_batch,
+                self.vad,
+                [chunk.data for chunk in audio_chunks],
+            )
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "VAD batch analysis (chunks=%d, speech_chunks=%d)",
+                    len(speech_flags),
+                    sum(speech_flags),
+                )
+        except Exception as e:
+            logger.error("Failed to detect speech: %s", e, exc_info=True)
+            raise VADError(f"Failed to detect speech: {e}") from e
+        else:
+            return speech_flags
+
+    def _detect_speech_batch(self, vad: webrtcvad.Vad, batch: list[np.ndarray]) -> list[bool]:
+        """Run VAD over a batch of chunks (synchronous method for thread pool).
+
+        Args:
+            vad: WebRTC VAD instance
+            batch: Float32 audio samples for each chunk
+
+        Returns:
+            list[bool]: True for each chunk where the majority of frames contain speech
+        """
+        speech_flags = []
+        for audio_data in batch:
+            speech_frames, total_frames = self._count_speech_frames(vad, audio_data)
+            speech_flags.append(total_frames > 0 and speech_frames / total_frames > 0.5)
+
+        return speech_flags
+
+    def _count_speech_frames(self, vad: webrtcvad.Vad, audio_data: np.ndarray) -> tuple[int, int]:
+        """Run VAD over each frame of a chunk (synchronous method for thread pool).
+
+        Args:
+            vad: WebRTC VAD instance
+            audio_data: Float32 audio samples
+
+        Returns:
+            tuple[int, int]: Number of speech frames and total number of frames
+        """
+        frame_bytes = self.frame_size * 2  # int16 samples
+
+        # Convert the whole chunk to PCM once, then hand VAD slices of it
+        pcm = self._float32_to_int16(audio_data).tobytes()
+        speech_frames = 0
+        total_frames = 0
+
+        for start in range(0, len(pcm) - frame_bytes + 1, frame_bytes):
+            if vad.is_speech(pcm[start : start + frame_bytes], self.sample_rate):
+                speech_frames += 1
+            total_frames += 1
+
+        return speech_frames, total_frames
+
     async def shutdown(self) -> None:
         """Shut down the VAD and release resources."""
         logger.info("Shutting down WebRTC VAD")
@@ -184,10 +244,8 @@ class WebRTCVAD(IVoiceActivationDetector):
         Returns:
             np.ndarray: Audio samples as int16
         """
-        # Clip to [-1.0, 1.0]
-        audio = np.clip(audio, -1.0, 1.0)
-
-        # Convert to int16 range
-        audio_int16 = (audio * 32767).astype(np.int16)
+        # Scale to int16 range, then clip in place to avoid another temporary
+        scaled: np.ndarray = np.multiply(audio, 32767, dtype=np.float32)
+        np.clip(scaled, -32767, 32767, out=scaled)
 
-        return audio_int16
+        return scaled.astype(np.int16)
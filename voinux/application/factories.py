@@ -155,6 +155,7 @@ async def create_speech_recognizer(
             language=config.faster_whisper.language,
             vad_filter=False,  # We handle VAD ourselves
             model_path=config.faster_whisper.model_path,
+            cpu_threads=config.faster_whisper.cpu_threads,
             provider="whisper",
         )
 
@@ -46,6 +46,8 @@ class StartTranscription:
         self.enable_silence_trimming = enable_silence_trimming
         self.pipeline: TranscriptionPipeline | None = None
         self.session_manager = SessionManager()
+        # The event loop only keeps weak references to tasks, so hold on to them
+        self._stop_tasks: set[asyncio.Task[None]] = set()
 
     async def execute(
         self,
@@ -67,6 +69,8 @@ class StartTranscription:
         Raises:
             InitializationError: If initialization fails
         """
+        signal_loop: asyncio.AbstractEventLoop | None = None
+
         try:
             logger.info("Starting transcription use case")
 
@@ -92,6 +96,7 @@ class StartTranscription:
                 language=self.config.faster_whisper.language,
                 vad_filter=False,
                 model_path=self.config.faster_whisper.model_path,
+                cpu_threads=self.config.faster_whisper.cpu_threads,
                 provider=actual_provider,
                 api_key=api_key,
             )
@@ -141,6 +146,10 @@ class StartTranscription:
                 silence_threshold_ms=self.config.buffering.silence_threshold_ms,
                 max_buffer_duration_ms=self.config.buffering.max_buffer_duration_ms,
                 min_utterance_duration_ms=self.config.buffering.min_utterance_duration_ms,
+                vad_batch_size=self.config.buffering.vad_batch_size,
+                silence_peak_threshold=self.config.buffering.silence_peak_threshold,
+                adaptive_silence_threshold=self.config.buffering.adaptive_silence_threshold,
+                min_silence_threshold_ms=self.config.buffering.min_silence_threshold_ms,
             )
 
             # Create pipeline
@@ -158,12 +167,9 @@ class StartTranscription:
 
             # Set up signal handlers for graceful shutdown (CLI mode only)
             if install_signal_handlers:
-                loop = asyncio.get_event_loop()
+                signal_loop = asyncio.get_event_loop()
                 for sig in (signal.SIGINT, signal.SIGTERM):
-                    loop.add_signal_handler(
-                        sig,
-                        lambda: asyncio.create_task(self.stop()),
-                    )
+                    signal_loop.add_signal_handler(sig, self._request_stop)
                 logger.debug("Signal handlers installed for SIGINT and SIGTERM")
 
             # Start transcription
@@ -181,6 +187,25 @@ class StartTranscription:
             raise InitializationError(f"Failed to start transcription: {e}") from e
         else:
             return completed_session if completed_session else session
+        finally:
+            # Let a signal-triggered stop() finish shutting down the adapters, even on failure
+            if self._stop_tasks:
+                await asyncio.gather(*self._stop_tasks, return_exceptions=True)
+
+            # Drop the pipeline so its adapters and buffers can be freed after the session
+            self.pipeline = None
+
+            # Don't leave the loop holding on to this use case after the session ends
+            if signal_loop:
+                for sig in (signal.SIGINT, signal.SIGTERM):
+                    signal_loop.remove_signal_handler(sig)
+                logger.debug("Signal handlers removed for SIGINT and SIGTERM")
+
+    def _request_stop(self) -> None:
+        """Schedule stop() from a signal handler, keeping the task referenced."""
+        task = asyncio.create_task(self.stop())
+        self._stop_tasks.add(task)
+        task.add_done_callback(self._stop_tasks.discard)
 
     async def stop(self) -> None:
         """Stop the transcription pipeline."""
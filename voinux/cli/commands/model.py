@@ -7,7 +7,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from voinux.application.factories import create_model_manager
 from voinux.config.loader import ConfigLoader
 
 
@@ -30,6 +29,8 @@ def model_list(ctx: click.Context) -> None:
         config = await loader.load()
 
         # Get model manager
+        from voinux.application.factories import create_model_manager
+
         model_manager = create_model_manager(config)
         models = await model_manager.list_cached_models()
 
@@ -79,6 +80,8 @@ def model_download(ctx: click.Context, model_name: str, force: bool) -> None:
         config = await loader.load()
 
         # Get model manager
+        from voinux.application.factories import create_model_manager
+
         model_manager = create_model_manager(config)
 
         # Check if already cached
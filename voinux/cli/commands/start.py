@@ -9,7 +9,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from voinux.application.use_cases import StartTranscription
 from voinux.config.loader import ConfigLoader
 
 logger = logging.getLogger(__name__)
@@ -65,6 +64,8 @@ def start(
     console: Console = ctx.obj["console"]
 
     async def _start() -> None:
+        # Deferred so other commands don't load the STT/audio stack at startup
+        from voinux.application.use_cases import StartTranscription
         from voinux.cli.privacy import show_cloud_privacy_notice, show_provider_indicator
 
         logger.info("Start command invoked")
@@ -7,7 +7,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from voinux.application.use_cases import TestAudio, TestGPU
 from voinux.config.loader import ConfigLoader
 
 
@@ -30,6 +29,8 @@ def test_audio(ctx: click.Context, duration: int) -> None:
         config = await loader.load()
 
         # Run test
+        from voinux.application.use_cases import TestAudio
+
         use_case = TestAudio(config)
 
         with console.status("[yellow]Recording audio...[/yellow]"):
@@ -71,6 +72,8 @@ def test_gpu(ctx: click.Context) -> None:
         config = await loader.load()
 
         # Run test
+        from voinux.application.use_cases import TestGPU
+
         use_case = TestGPU(config)
         results = await use_case.execute()
 
@@ -14,6 +14,7 @@ class FasterWhisperConfig:
     beam_size: int = 5  # Beam size for decoding
     language: str | None = None  # Target language (None for auto-detection)
     model_path: str | None = None  # Custom model path (None for default cache)
+    cpu_threads: int = 0  # CPU threads for inference (0 for the CTranslate2 default)
 
 
 @dataclass
@@ -51,6 +52,10 @@ class BufferingConfig:
     silence_threshold_ms: int = 1200  # Wait time after speech before processing
     max_buffer_duration_ms: int = 30000  # Maximum buffer size (30 seconds)
     min_utterance_duration_ms: int = 300  # Minimum utterance duration to process
+    vad_batch_size: int = 1  # Chunks per VAD call (higher = fewer calls, more latency)
+    silence_peak_threshold: float = 0.0  # Skip VAD for idle chunks below this peak (0 = off)
+    adaptive_silence_threshold: bool = False  # Shorter silence wait for short utterances
+    min_silence_threshold_ms: int = 300  # Lower bound for the adaptive silence wait
 
 
 @dataclass
@@ -136,6 +141,10 @@ class Config:
         if self.faster_whisper.beam_size < 1:
             raise ValueError(f"beam_size must be >= 1, got {self.faster_whisper.beam_size}")
 
+        # Validate CPU threads
+        if self.faster_whisper.cpu_threads < 0:
+            raise ValueError(f"cpu_threads must be >= 0, got {self.faster_whisper.cpu_threads}")
+
         # Validate audio config
         if self.audio.sample_rate <= 0:
             raise ValueError(f"sample_rate must be > 0, got {self.audio.sample_rate}")
@@ -169,6 +178,17 @@ class Config:
             raise ValueError(
                 f"min_utterance_duration_ms must be >= 0, got {self.buffering.min_utterance_duration_ms}"
             )
+        if self.buffering.vad_batch_size < 1:
+            raise ValueError(f"vad_batch_size must be >= 1, got {self.buffering.vad_batch_size}")
+        if not 0.0 <= self.buffering.silence_peak_threshold < 1.0:
+            raise ValueError(
+                "silence_peak_threshold must be between 0.0 and 1.0, "
+                f"got {self.buffering.silence_peak_threshold}"
+            )
+        if self.buffering.min_silence_threshold_ms < 0:
+            raise ValueError(
+                f"min_silence_threshold_ms must be >= 0, got {self.buffering.min_silence_threshold_ms}"
+            )
 
         # Validate noise suppression config
         if not 0.0 <= self.noise_suppression.prop_decrease <= 1.0:
@@ -3,6 +3,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from typing import ClassVar
 
 import numpy as np
 import numpy.typing as npt
@@ -64,6 +65,7 @@ class ModelConfig:
     language: str | None  # Target language (None for auto-detection)
     vad_filter: bool  # Whether to use VAD filtering
     model_path: str | None  # Custom model path (None for default cache)
+    cpu_threads: int = 0  # CPU threads for local inference (0 for the backend default)
     # Cloud provider fields (optional, for cloud STT)
     provider: str = "whisper"  # Provider name ("whisper", "gemini") - always defaults to whisper
     api_key: str | None = None  # API key for cloud providers (None for offline)
@@ -101,6 +103,9 @@ class ModelConfig:
         if self.beam_size < 1:
             raise ValueError(f"beam_size must be >= 1, got {self.beam_size}")
 
+        if self.cpu_threads < 0:
+            raise ValueError(f"cpu_threads must be >= 0, got {self.cpu_threads}")
+
         # Validate provider
         valid_providers = {"whisper", "gemini"}
         if self.provider not in valid_providers:
@@ -126,6 +131,10 @@ class BufferConfig:
     silence_threshold_ms: int = 1200  # Wait time after speech before processing
     max_buffer_duration_ms: int = 30000  # Maximum buffer size (30 seconds)
     min_utterance_duration_ms: int = 300  # Minimum utterance to process
+    vad_batch_size: int = 1  # Number of chunks passed to the VAD per call
+    silence_peak_threshold: float = 0.0  # Peak below which idle chunks skip VAD (0 = off)
+    adaptive_silence_threshold: bool = False  # Scale silence wait with utterance length
+    min_silence_threshold_ms: int = 300  # Shortest silence wait when adaptive
 
     def __post_init__(self) -> None:
         """Validate buffer configuration."""
@@ -139,19 +148,41 @@ class BufferConfig:
             raise ValueError(
                 f"min_utterance_duration_ms must be >= 0, got {self.min_utterance_duration_ms}"
             )
+        if self.vad_batch_size < 1:
+            raise ValueError(f"vad_batch_size must be >= 1, got {self.vad_batch_size}")
+        if not 0.0 <= self.silence_peak_threshold < 1.0:
+            raise ValueError(
+                "silence_peak_threshold must be between 0.0 and 1.0, "
+                f"got {self.silence_peak_threshold}"
+            )
+        if self.min_silence_threshold_ms < 0:
+            raise ValueError(
+                f"min_silence_threshold_ms must be >= 0, got {self.min_silence_threshold_ms}"
+            )
 
 
 @dataclass
 class SpeechBuffer:
-    """Manages buffering of audio chunks until utterance is complete."""
+    """Manages buffering of audio chunks until utterance is complete.
+
+    Speech samples are written into a single preallocated array sized for
+    ``max_buffer_duration_ms``, so building the utterance does not require
+    concatenating the individual chunks.
+    """
+
+    # Buffered speech after which an adaptive silence threshold reaches its full value
+    ADAPTIVE_SILENCE_RAMP_MS: ClassVar[int] = 2000
 
     buffer_config: BufferConfig
     sample_rate: int
     state: SpeechState = SpeechState.IDLE
-    buffered_chunks: list[AudioChunk] = field(default_factory=list)
+    buffered_chunk_count: int = 0
     silence_duration_ms: int = 0
     total_buffered_duration_ms: int = 0
     utterance_start_time: datetime | None = None
+    _samples: npt.NDArray[np.float32] | None = field(default=None, init=False, repr=False)
+    _write_pos: int = field(default=0, init=False, repr=False)
+    _samples_shared: bool = field(default=False, init=False, repr=False)
 
     def add_chunk(self, chunk: AudioChunk, is_speech: bool) -> None:
         """Add a chunk to the buffer and update state.
@@ -171,12 +202,33 @@ class SpeechBuffer:
 
             # Add chunk to buffer
             if self.state == SpeechState.BUFFERING:
-                self.buffered_chunks.append(chunk)
+                self._write_samples(chunk.data)
+                self.buffered_chunk_count += 1
                 self.total_buffered_duration_ms += chunk.duration_ms
         # Increment silence counter if we were buffering
         elif self.state == SpeechState.BUFFERING:
             self.silence_duration_ms += chunk.duration_ms
 
+    def _write_samples(self, data: npt.NDArray[np.float32]) -> None:
+        """Copy chunk samples into the preallocated sample array.
+
+        Args:
+            data: Audio samples to append
+        """
+        end = self._write_pos + len(data)
+
+        if self._samples is None:
+            capacity = (self.sample_rate * self.buffer_config.max_buffer_duration_ms) // 1000
+            self._samples = np.empty(max(capacity, end), dtype=np.float32)
+        elif end > len(self._samples):
+            # The max duration check runs after a chunk is added, so allow overshoot
+            grown = np.empty(max(2 * len(self._samples), end), dtype=np.float32)
+            grown[: self._write_pos] = self._samples[: self._write_pos]
+            self._samples = grown
+
+        self._samples[self._write_pos : end] = data
+        self._write_pos = end
+
     def should_process(self) -> bool:
         """Check if the buffer should be processed.
 
@@ -184,16 +236,37 @@ class SpeechBuffer:
             bool: True if buffer should be processed
         """
         # Don't process if idle or empty
-        if self.state != SpeechState.BUFFERING or not self.buffered_chunks:
+        if self.state != SpeechState.BUFFERING or self.buffered_chunk_count == 0:
             return False
 
         # Process if silence threshold reached
-        if self.silence_duration_ms >= self.buffer_config.silence_threshold_ms:
+        if self.silence_duration_ms >= self.silence_threshold_ms():
             return True
 
         # Process if max buffer duration reached (safety limit)
         return self.total_buffered_duration_ms >= self.buffer_config.max_buffer_duration_ms
 
+    def silence_threshold_ms(self) -> int:
+        """Get the silence duration that ends the current utterance.
+
+        With adaptive thresholds, the wait grows linearly with the buffered speech
+        and reaches the configured threshold after ``ADAPTIVE_SILENCE_RAMP_MS``, so
+        short commands are processed sooner while pauses in longer dictation are
+        tolerated. The wait never exceeds the configured threshold.
+
+        Returns:
+            int: Silence threshold in milliseconds
+        """
+        config = self.buffer_config
+        if not config.adaptive_silence_threshold:
+            return config.silence_threshold_ms
+
+        scale = min(self.total_buffered_duration_ms / self.ADAPTIVE_SILENCE_RAMP_MS, 1.0)
+        threshold_ms = max(
+            config.min_silence_threshold_ms, int(config.silence_threshold_ms * scale)
+        )
+        return min(threshold_ms, config.silence_threshold_ms)
+
     def should_ignore(self) -> bool:
         """Check if the buffered utterance should be ignored (too short).
 
@@ -203,7 +276,10 @@ class SpeechBuffer:
         return self.total_buffered_duration_ms < self.buffer_config.min_utterance_duration_ms
 
     def get_concatenated_audio(self) -> AudioChunk:
-        """Concatenate all buffered chunks into a single AudioChunk.
+        """Get all buffered audio as a single AudioChunk.
+
+        The returned data is a view of the internal sample array. The buffer
+        allocates a fresh array on the next reset() so the view stays valid.
 
         Returns:
             AudioChunk: Single chunk containing all buffered audio
@@ -211,29 +287,31 @@ class SpeechBuffer:
         Raises:
             ValueError: If buffer is empty
         """
-        if not self.buffered_chunks:
+        if self._samples is None or self.buffered_chunk_count == 0:
             raise ValueError("Cannot concatenate empty buffer")
 
-        # Concatenate all audio data
-        concatenated_data = np.concatenate([chunk.data for chunk in self.buffered_chunks])
-
-        # Use the timestamp of the first chunk
-        first_chunk = self.buffered_chunks[0]
+        self._samples_shared = True
 
         return AudioChunk(
-            data=concatenated_data,
+            data=self._samples[: self._write_pos],
             sample_rate=self.sample_rate,
-            timestamp=first_chunk.timestamp,
+            timestamp=self.utterance_start_time or datetime.now(),
             duration_ms=self.total_buffered_duration_ms,
         )
 
     def reset(self) -> None:
         """Reset the buffer to idle state."""
         self.state = SpeechState.IDLE
-        self.buffered_chunks.clear()
+        self.buffered_chunk_count = 0
         self.silence_duration_ms = 0
         self.total_buffered_duration_ms = 0
         self.utterance_start_time = None
+        self._write_pos = 0
+
+        # Drop the array if a view of it was handed out, otherwise reuse it
+        if self._samples_shared:
+            self._samples = None
+            self._samples_shared = False
 
 
 @dataclass
@@ -258,14 +336,15 @@ class TranscriptionSession:
     is_active: bool = True
     ended_at: datetime | None = None
 
-    def record_chunk(self, is_speech: bool, transcription_time_ms: int = 0) -> None:
+    def record_chunk(self, is_speech: bool) -> None:
         """Record processing of an audio chunk."""
-        self.total_chunks_processed += 1
-        if is_speech:
-            self.total_speech_chunks += 1
-            self.total_transcription_time_ms += transcription_time_ms
-        else:
-            self.total_silence_chunks += 1
+        self.record_chunks(1, int(is_speech))
+
+    def record_chunks(self, chunk_count: int, speech_chunk_count: int) -> None:
+        """Record processing of a batch of audio chunks."""
+        self.total_chunks_processed += chunk_count
+        self.total_speech_chunks += speech_chunk_count
+        self.total_silence_chunks += chunk_count - speech_chunk_count
 
     def record_utterance(
         self, utterance_duration_ms: int, transcription_time_ms: int, was_overflow: bool = False
@@ -129,6 +129,23 @@ class IVoiceActivationDetector(ABC):
         """
         ...
 
+    async def is_speech_batch(self, audio_chunks: list[AudioChunk]) -> list[bool]:
+        """Determine which of several audio chunks contain speech.
+
+        The default implementation calls is_speech() once per chunk. Adapters should
+        override it when they can analyze a whole batch in a single call.
+
+        Args:
+            audio_chunks: Audio chunks to analyze, in capture order
+
+        Returns:
+            list[bool]: Speech decision for each chunk, in the same order
+
+        Raises:
+            VADError: If detection fails
+        """
+        return [await self.is_speech(audio_chunk) for audio_chunk in audio_chunks]
+
     @abstractmethod
     async def shutdown(self) -> None:
         """Shut down the VAD and release resources."""
@@ -198,7 +215,7 @@ class IModelManager(ABC):
             model_name: Name of the model
 
         Returns:
-            Optional[Path]: Path to the model, or None if not cached
+            Path | None: Path to the model, or None if not cached
         """
         ...
 
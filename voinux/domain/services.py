@@ -3,14 +3,18 @@
 import asyncio
 import logging
 import uuid
+from collections import deque
 from collections.abc import Callable
 from datetime import datetime
 
+import numpy as np
+
 from voinux.domain.entities import (
     AudioChunk,
     BufferConfig,
     ModelConfig,
     SpeechBuffer,
+    SpeechState,
     TranscriptionSession,
 )
 from voinux.domain.exceptions import SessionError, TranscriptionError
@@ -30,8 +34,35 @@ class TranscriptionPipeline:
 
     Uses utterance-based buffering: buffers audio chunks while speaking,
     waits for silence, then transcribes complete utterances.
+
+    Capture, noise suppression, VAD, transcription and typing run as separate
+    tasks connected by bounded queues, so a slow stage does not hold up the others.
     """
 
+    # Maximum number of items waiting between two pipeline stages
+    STAGE_QUEUE_SIZE = 8
+
+    __slots__ = (
+        "_chunk_queue",
+        "_max_buffer_ms",
+        "_running",
+        "_silence_peak",
+        "_speech_buffer",
+        "_stop_event",
+        "_typing_queue",
+        "_utterance_queue",
+        "_vad_queue",
+        "audio_capture",
+        "buffer_config",
+        "keyboard",
+        "noise_suppressor",
+        "on_audio_chunk",
+        "recognizer",
+        "session",
+        "vad",
+        "vad_enabled",
+    )
+
     def __init__(
         self,
         audio_capture: IAudioCapture,
@@ -63,12 +94,19 @@ class TranscriptionPipeline:
         self.keyboard = keyboard
         self.session = session
         self.buffer_config = buffer_config or BufferConfig()
+        # Thresholds read on the hot path, cached as plain values
+        self._max_buffer_ms = self.buffer_config.max_buffer_duration_ms
+        self._silence_peak = self.buffer_config.silence_peak_threshold
         self.vad_enabled = vad_enabled
         self.noise_suppressor = noise_suppressor
         self.on_audio_chunk = on_audio_chunk
         self._running = False
         self._stop_event: asyncio.Event | None = None
         self._speech_buffer: SpeechBuffer | None = None
+        self._chunk_queue: asyncio.Queue[AudioChunk | None] = asyncio.Queue()
+        self._vad_queue: asyncio.Queue[AudioChunk | None] = self._chunk_queue
+        self._utterance_queue: asyncio.Queue[tuple[AudioChunk, bool] | None] = asyncio.Queue()
+        self._typing_queue: asyncio.Queue[str | None] = asyncio.Queue()
 
     async def start(self) -> None:
         """Start the transcription pipeline.
@@ -81,11 +119,12 @@ class TranscriptionPipeline:
 
         logger.info(
             "Starting transcription pipeline (session_id=%s, vad_enabled=%s, "
-            "silence_threshold=%dms, max_buffer=%dms)",
+            "silence_threshold=%dms, adaptive_silence=%s, max_buffer=%dms)",
             self.session.session_id,
             self.vad_enabled,
             self.buffer_config.silence_threshold_ms,
-            self.buffer_config.max_buffer_duration_ms,
+            self.buffer_config.adaptive_silence_threshold,
+            self._max_buffer_ms,
         )
 
         self._running = True
@@ -93,6 +132,14 @@ class TranscriptionPipeline:
 
         # Initialize speech buffer (we'll get sample rate from first chunk)
         self._speech_buffer = None
+        self._chunk_queue = asyncio.Queue(maxsize=self.STAGE_QUEUE_SIZE)
+        self._vad_queue = (
+            asyncio.Queue(maxsize=self.STAGE_QUEUE_SIZE)
+            if self.noise_suppressor
+            else self._chunk_queue
+        )
+        self._utterance_queue = asyncio.Queue(maxsize=self.STAGE_QUEUE_SIZE)
+        self._typing_queue = asyncio.Queue(maxsize=self.STAGE_QUEUE_SIZE)
 
         try:
             await self.audio_capture.start()
@@ -103,6 +150,9 @@ class TranscriptionPipeline:
             self.session.end()
             logger.error("Pipeline failed: %s", e, exc_info=True)
             raise TranscriptionError(f"Pipeline failed: {e}") from e
+        finally:
+            # Release the preallocated utterance samples once the stream has ended
+            self._speech_buffer = None
 
     async def stop(self) -> None:
         """Stop the transcription pipeline gracefully."""
@@ -115,36 +165,139 @@ class TranscriptionPipeline:
         if self._stop_event:
             self._stop_event.set()
 
-        await self.audio_capture.stop()
-        await self.recognizer.shutdown()
-        await self.vad.shutdown()
+        shutdowns = [self.audio_capture.stop(), self.recognizer.shutdown(), self.vad.shutdown()]
         if self.noise_suppressor:
-            await self.noise_suppressor.shutdown()
+            shutdowns.append(self.noise_suppressor.shutdown())
+
+        # Shut down every adapter even if one of them fails
+        for result in await asyncio.gather(*shutdowns, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error("Failed to shut down pipeline component: %s", result, exc_info=result)
         self.session.end()
 
         logger.info("Transcription pipeline stopped")
 
     async def _run_pipeline(self) -> None:
-        """Main pipeline loop that processes audio chunks."""
-        try:
-            async for audio_chunk in self.audio_capture.stream():
-                if not self._running:
-                    break
+        """Run the pipeline stages until the stream ends.
 
-                await self._process_chunk(audio_chunk)
+        Each stage passes a None sentinel downstream when it finishes. If any stage
+        fails, the remaining stages are cancelled and the error is raised.
+        """
+        tasks = [
+            asyncio.create_task(self._capture_stage()),
+            asyncio.create_task(self._vad_stage()),
+            asyncio.create_task(self._transcription_stage()),
+            asyncio.create_task(self._typing_stage()),
+        ]
+        if self.noise_suppressor:
+            tasks.append(asyncio.create_task(self._noise_suppression_stage(self.noise_suppressor)))
+
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if not task.cancelled() and (error := task.exception()) is not None:
+                    raise error
         except Exception as e:
             raise TranscriptionError(f"Pipeline processing failed: {e}") from e
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-    async def _process_chunk(self, audio_chunk: AudioChunk) -> None:
-        """Process a single audio chunk through the buffering pipeline.
+    async def _capture_stage(self) -> None:
+        """Read chunks from the audio capture adapter and queue them for VAD."""
+        async for audio_chunk in self.audio_capture.stream():
+            if not self._running:
+                break
+
+            await self._chunk_queue.put(audio_chunk)
+
+        await self._chunk_queue.put(None)
+
+    async def _noise_suppression_stage(self, noise_suppressor: IAudioProcessor) -> None:
+        """Apply noise suppression to captured chunks and queue them for VAD.
+
+        Running as its own stage lets the processor work on the next chunk while
+        the VAD stage is still analyzing the previous one.
 
         Args:
-            audio_chunk: Audio chunk to process
+            noise_suppressor: Audio processor to apply to each chunk
         """
-        # Apply noise suppression if enabled
-        if self.noise_suppressor:
-            audio_chunk = await self.noise_suppressor.process(audio_chunk)
+        while (audio_chunk := await self._chunk_queue.get()) is not None:
+            if not self._running:
+                continue
+
+            await self._vad_queue.put(await noise_suppressor.process(audio_chunk))
+
+        await self._vad_queue.put(None)
+
+    async def _vad_stage(self) -> None:
+        """Run VAD and buffering over queued chunks.
+
+        Chunks are collected into batches of ``buffer_config.vad_batch_size`` so the
+        VAD can analyze several chunks per call.
+        """
+        pending: deque[AudioChunk] = deque()
+        batch_size = self.buffer_config.vad_batch_size
+
+        while (audio_chunk := await self._vad_queue.get()) is not None:
+            # Keep draining after stop() so upstream stages never block
+            if not self._running:
+                continue
 
+            self._ensure_speech_buffer(audio_chunk)
+            pending.append(audio_chunk)
+            if len(pending) >= batch_size:
+                await self._process_batch(pending)
+
+        # Flush a partial batch if the stream ended on its own
+        if pending and self._running:
+            await self._process_batch(pending)
+
+        await self._utterance_queue.put(None)
+
+    async def _transcription_stage(self) -> None:
+        """Transcribe queued utterances and queue the text for typing."""
+        discarded = 0
+        while (utterance := await self._utterance_queue.get()) is not None:
+            # Recognizer is shut down by stop(), so drop anything still queued
+            if not self._running:
+                discarded += 1
+                continue
+
+            utterance_audio, was_overflow = utterance
+            await self._transcribe_utterance(utterance_audio, was_overflow)
+
+        if discarded:
+            logger.warning("Discarded %d queued utterance(s) after pipeline stop", discarded)
+
+        await self._typing_queue.put(None)
+
+    async def _typing_stage(self) -> None:
+        """Type queued transcriptions into the active window.
+
+        Keystroke emission can take hundreds of milliseconds for a long sentence;
+        running it as its own stage lets the next utterance be transcribed meanwhile.
+
+        Raises:
+            TranscriptionError: If typing fails
+        """
+        # Keep typing after stop(): the text was already spoken and transcribed
+        while (text := await self._typing_queue.get()) is not None:
+            try:
+                logger.debug("Typing transcribed text (%d characters)", len(text))
+                await self.keyboard.type_text(text)
+                self.session.record_typing(len(text))
+            except Exception as e:
+                logger.error("Failed to type transcription: %s", e, exc_info=True)
+                raise TranscriptionError(f"Failed to type transcription: {e}") from e
+
+    def _ensure_speech_buffer(self, audio_chunk: AudioChunk) -> None:
+        """Create the speech buffer from the first chunk's sample rate.
+
+        Args:
+            audio_chunk: Chunk about to be buffered
+        """
         # Initialize speech buffer on first chunk
         if self._speech_buffer is None:
             self._speech_buffer = SpeechBuffer(
@@ -157,25 +310,77 @@ class TranscriptionPipeline:
                 audio_chunk.duration_ms,
             )
 
-        # Check for speech using VAD
-        is_speech = True
+    async def _process_batch(self, pending: deque[AudioChunk]) -> None:
+        """Run VAD over a batch of chunks and process them in capture order.
+
+        Args:
+            pending: Prepared chunks awaiting VAD (emptied by this call)
+        """
+        batch = list(pending)
+        pending.clear()
+
         if self.vad_enabled:
-            is_speech = await self.vad.is_speech(audio_chunk)
-            logger.debug(
-                "Audio chunk processed (duration=%dms, is_speech=%s, chunks_processed=%d)",
-                audio_chunk.duration_ms,
-                is_speech,
-                self.session.total_chunks_processed + 1,
-            )
+            gated = self._count_gated_chunks(batch)
+            speech_flags = [False] * gated
+            if gated < len(batch):
+                speech_flags += await self.vad.is_speech_batch(batch[gated:])
         else:
-            logger.debug(
-                "Audio chunk received (duration=%dms, chunks_processed=%d, vad_disabled)",
-                audio_chunk.duration_ms,
-                self.session.total_chunks_processed + 1,
-            )
+            speech_flags = [True] * len(batch)
+
+        # Record the whole batch in session statistics at once
+        self.session.record_chunks(len(batch), sum(speech_flags))
+
+        for audio_chunk, is_speech in zip(batch, speech_flags, strict=True):
+            await self._process_chunk(audio_chunk, is_speech)
+
+    def _count_gated_chunks(self, batch: list[AudioChunk]) -> int:
+        """Count leading chunks quiet enough to be classified as silence without VAD.
+
+        Only applies while no utterance is being buffered, so quiet tails of an
+        utterance still go through the VAD.
+
+        Args:
+            batch: Chunks about to be passed to the VAD
+
+        Returns:
+            int: Number of chunks at the start of the batch that can skip the VAD
+        """
+        if self._silence_peak <= 0.0 or (
+            self._speech_buffer is not None and self._speech_buffer.state != SpeechState.IDLE
+        ):
+            return 0
 
-        # Record chunk in session statistics
-        self.session.record_chunk(is_speech=is_speech)
+        gated = 0
+        for audio_chunk in batch:
+            if len(audio_chunk.data) and np.abs(audio_chunk.data).max() >= self._silence_peak:
+                break
+            gated += 1
+
+        return gated
+
+    async def _process_chunk(self, audio_chunk: AudioChunk, is_speech: bool) -> None:
+        """Process a single audio chunk through the buffering pipeline.
+
+        Args:
+            audio_chunk: Audio chunk to process
+            is_speech: VAD decision for the chunk (always True when VAD is disabled)
+        """
+        if self._speech_buffer is None:
+            return
+
+        # Skip building per-chunk log arguments unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            if self.vad_enabled:
+                logger.debug(
+                    "Audio chunk processed (duration=%dms, is_speech=%s)",
+                    audio_chunk.duration_ms,
+                    is_speech,
+                )
+            else:
+                logger.debug(
+                    "Audio chunk received (duration=%dms, vad_disabled)",
+                    audio_chunk.duration_ms,
+                )
 
         # Call audio chunk callback if provided (for GUI updates)
         if self.on_audio_chunk:
@@ -189,7 +394,7 @@ class TranscriptionPipeline:
             await self._process_buffered_utterance()
 
     async def _process_buffered_utterance(self) -> None:
-        """Process the complete buffered utterance."""
+        """Take the complete buffered utterance and queue it for transcription."""
         if self._speech_buffer is None:
             return
 
@@ -198,46 +403,58 @@ class TranscriptionPipeline:
             logger.debug(
                 "Ignoring utterance (too short: %dms < %dms minimum)",
                 self._speech_buffer.total_buffered_duration_ms,
-                self._speech_buffer.buffer_config.min_utterance_duration_ms,
+                self.buffer_config.min_utterance_duration_ms,
             )
             self._speech_buffer.reset()
             return
 
-        try:
-            # Get concatenated audio
-            utterance_audio = self._speech_buffer.get_concatenated_audio()
-            utterance_duration_ms = self._speech_buffer.total_buffered_duration_ms
-
-            # Check if this was a buffer overflow
-            was_overflow = (
-                self._speech_buffer.total_buffered_duration_ms
-                >= self._speech_buffer.buffer_config.max_buffer_duration_ms
+        # Get concatenated audio
+        utterance_audio = self._speech_buffer.get_concatenated_audio()
+        utterance_duration_ms = self._speech_buffer.total_buffered_duration_ms
+
+        # Check if this was a buffer overflow
+        was_overflow = utterance_duration_ms >= self._max_buffer_ms
+
+        if was_overflow:
+            logger.warning(
+                "Buffer overflow detected! Processing utterance (duration=%dms >= max=%dms)",
+                utterance_duration_ms,
+                self._max_buffer_ms,
+            )
+        else:
+            logger.info(
+                "Processing buffered utterance (duration=%dms, chunks=%d)",
+                utterance_duration_ms,
+                self._speech_buffer.buffered_chunk_count,
             )
 
-            if was_overflow:
-                logger.warning(
-                    "Buffer overflow detected! Processing utterance (duration=%dms >= max=%dms)",
-                    utterance_duration_ms,
-                    self._speech_buffer.buffer_config.max_buffer_duration_ms,
-                )
-            else:
-                logger.info(
-                    "Processing buffered utterance (duration=%dms, chunks=%d)",
-                    utterance_duration_ms,
-                    len(self._speech_buffer.buffered_chunks),
-                )
+        # Reset buffer before transcription (so we can start buffering next utterance)
+        self._speech_buffer.reset()
 
-            # Reset buffer before transcription (so we can start buffering next utterance)
-            self._speech_buffer.reset()
+        await self._utterance_queue.put((utterance_audio, was_overflow))
+
+    async def _transcribe_utterance(self, utterance_audio: AudioChunk, was_overflow: bool) -> None:
+        """Transcribe a complete utterance and queue the result for typing.
+
+        Args:
+            utterance_audio: Concatenated audio of the utterance
+            was_overflow: Whether the utterance was cut at the max buffer duration
 
+        Raises:
+            TranscriptionError: If transcription fails
+        """
+        utterance_duration_ms = utterance_audio.duration_ms
+
+        try:
             # Transcribe the complete utterance
             logger.info("Starting transcription...")
             result = await self.recognizer.transcribe(utterance_audio)
+            text = result.text.strip()
 
             logger.info(
                 "Transcription complete (text='%s', language=%s, confidence=%.2f, "
                 "processing_time=%dms)",
-                result.text.strip(),
+                text,
                 result.language or "unknown",
                 result.confidence,
                 result.processing_time_ms,
@@ -262,18 +479,13 @@ class TranscriptionPipeline:
                     self.session.estimated_cost_usd,
                 )
 
-            # Type the transcribed text
-            if result.text.strip():
-                logger.debug("Typing transcribed text (%d characters)", len(result.text))
-                await self.keyboard.type_text(result.text)
-                self.session.record_typing(len(result.text))
+            # Hand the transcribed text to the typing stage
+            if text:
+                await self._typing_queue.put(text)
             else:
                 logger.debug("Transcription result was empty, skipping typing")
 
         except Exception as e:
-            # Reset buffer on error to avoid stuck state
-            if self._speech_buffer:
-                self._speech_buffer.reset()
             logger.error("Failed to process utterance: %s", e, exc_info=True)
             raise TranscriptionError(f"Failed to process utterance: {e}") from e
 
@@ -286,6 +498,8 @@ class TranscriptionPipeline:
 class SessionManager:
     """Service for managing transcription sessions."""
 
+    __slots__ = ("_current_session",)
+
     def __init__(self) -> None:
         """Initialize the session manager."""
         self._current_session: TranscriptionSession | None = None
@@ -305,7 +519,7 @@ class SessionManager:
         if self._current_session and self._current_session.is_active:
             raise SessionError("A session is already active. End it before creating a new one.")
 
-        session_id = str(uuid.uuid4())
+        session_id = uuid.uuid4().hex
         session = TranscriptionSession(
             session_id=session_id,
             started_at=datetime.now(),
@@ -327,7 +541,7 @@ class SessionManager:
         """Get the current active session.
 
         Returns:
-            Optional[TranscriptionSession]: Current session or None
+            TranscriptionSession | None: Current session or None
         """
         return self._current_session
 
@@ -335,7 +549,7 @@ class SessionManager:
         """End the current session and return it for reporting.
 
         Returns:
-            Optional[TranscriptionSession]: The ended session, or None if no active session
+            TranscriptionSession | None: The ended session, or None if no active session
         """
         if self._current_session:
             self._current_session.end()